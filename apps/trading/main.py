@@ -81,7 +81,7 @@ async def test():
         analysis_data = exchange.prepare_analysis_data()
 
         # AI 매매 결정
-        answer = ai_agent.invoke(source_data=analysis_data)
+        answer = ai_agent.invoke(source_data=analysis_data, ticker=exchange.ticker)
 
         # 매매 실행
         exchange.trading(answer=answer)
@@ -104,7 +104,7 @@ def run():
     analysis_data = exchange.prepareAnalysisData()
 
     # AI 매매 결정
-    answer = ai_agent.invoke(source_data=analysis_data)
+    answer = ai_agent.invoke(source_data=analysis_data, ticker=exchange.ticker)
 
     # 매매 실행
     exchange.trading(answer=answer)
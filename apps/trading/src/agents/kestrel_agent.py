@@ -1,14 +1,20 @@
+from langchain_core.exceptions import OutputParserException
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_core.output_parsers import JsonOutputParser
 
 # from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
 
+DECISIONS = ("buy", "sell", "hold")
+
+
 class KestrelAiModelAgent:
     llm: ChatOpenAI
     prompt: ChatPromptTemplate
     parser: JsonOutputParser
+    chain: Runnable | None = None
 
     def __init__(self):
         self.llm = ChatOpenAI(
@@ -20,7 +26,7 @@ class KestrelAiModelAgent:
 
     def create_prompt(self):
         system_template = """
-        You are a Bitcoin trading expert. Analyze market data and make trading decisions based on the following information:
+        You are a cryptocurrency trading expert. Analyze market data of the given market (ticker, e.g. KRW-BTC) and make trading decisions based on the following information:
 
         MARKET DATA:
         1. Investment Status
@@ -67,28 +73,148 @@ class KestrelAiModelAgent:
         self.prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", system_template),
-                ("human", "{source}"),
+                ("human", "Market: {ticker}\n\n{source}"),
             ]
         )
 
-    def invoke(self, source_data: str) -> dict:
+    def create_chain(self) -> Runnable:
+        """
+        프롬프트, LLM, 파서를 연결한 체인을 생성하는 함수 (한 번만 생성 후 재사용)
+
+        Returns:
+            Runnable: prompt | llm | parser 체인
+        """
+
+        if self.chain is None:
+            self.create_prompt()
+            self.prompt = self.prompt.partial(
+                format_instructions=self.parser.get_format_instructions()
+            )
+            self.chain = self.prompt | self.llm | self.parser
+        return self.chain
+
+    def validate_answer(self, answer) -> dict:
+        """
+        AI 모델의 응답이 올바른 매매 결정 형식인지 검증하는 함수
+
+        Args:
+            answer: 파서가 반환한 응답
+
+        Returns:
+            dict: 검증된 매매 결정 딕셔너리 (decision 은 소문자로 정규화)
+
+        Raises:
+            ValueError: decision 또는 reason 이 올바르지 않은 경우
+        """
+
+        if not isinstance(answer, dict):
+            raise ValueError(f"Invalid answer type: {type(answer).__name__}")
+
+        decision = answer.get("decision")
+        if not isinstance(decision, str) or decision.lower() not in DECISIONS:
+            raise ValueError(f"Invalid decision: {decision!r}")
+
+        reason = answer.get("reason")
+        if not isinstance(reason, str):
+            raise ValueError(f"Invalid reason: {reason!r}")
+
+        return {"decision": decision.lower(), "reason": reason}
+
+    def invoke(self, source_data: str, ticker: str = "KRW-BTC") -> dict:
         """
         AI 모델에 데이터를 전달하고 매매 결정을 받아오는 함수
 
         Args:
             source_data (str): JSON 형식의 분석 데이터 문자열 (캔들 데이터, 투자 상태, 호가 데이터 포함)
+            ticker (str): 분석 대상 종목 티커 (기본값: 'KRW-BTC')
 
         Returns:
             dict: 매매 결정 딕셔너리
                 - decision: 'buy', 'sell', 또는 'hold'
                 - reason: 결정에 대한 이유
+
+        Raises:
+            ValueError: 응답 형식이 올바르지 않은 경우
         """
 
-        self.create_prompt()
-        self.prompt = self.prompt.partial(
-            format_instructions=self.parser.get_format_instructions()
-        )
-        chain = self.prompt | self.llm | self.parser
-        answer = chain.invoke({"source": source_data})
+        chain = self.create_chain()
+        answer = chain.invoke({"ticker": ticker, "source": source_data})
         print("answer", answer)
-        return answer
+        return self.validate_answer(answer)
+
+    def batch_invoke(
+        self, source_data: dict[str, str], max_concurrency: int = 5
+    ) -> dict[str, dict]:
+        """
+        여러 종목의 데이터를 동시에 AI 모델에 전달하고 종목별 매매 결정을 받아오는 함수
+
+        Args:
+            source_data (dict[str, str]): 종목 티커(예: 'KRW-BTC')를 키로 하는 분석 데이터 문자열
+            max_concurrency (int): 동시에 요청할 최대 개수
+
+        Returns:
+            dict[str, dict]: 종목 티커별 매매 결정 딕셔너리
+                - decision: 'buy', 'sell', 또는 'hold'
+                - reason: 결정에 대한 이유
+                - error: 'hold' 로 대체된 경우에만 포함되는 오류 메시지
+                - error_type: 'hold' 로 대체된 경우에만 포함
+                    - 'parse': 응답 파싱 또는 검증 실패
+                    - 'api': 인증, 할당량, 네트워크 등 API 호출 실패
+
+        Raises:
+            ValueError: max_concurrency 가 1 보다 작은 경우
+            Exception: 모든 종목의 API 호출이 실패한 경우 첫 번째 오류를 그대로 전달
+        """
+
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+
+        tickers = list(source_data.keys())
+        if not tickers:
+            return {}
+
+        chain = self.create_chain()
+        answers = chain.batch(
+            [
+                {"ticker": ticker, "source": source_data[ticker]}
+                for ticker in tickers
+            ],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True,
+        )
+
+        results = {}
+        api_errors = []
+        for ticker, answer in zip(tickers, answers):
+            error = None
+            error_type = "parse"
+            if isinstance(answer, OutputParserException):
+                error = answer
+            elif isinstance(answer, Exception):
+                # API/네트워크 오류는 다른 종목의 결정을 버리지 않도록 별도 종류로 기록
+                error = answer
+                error_type = "api"
+                api_errors.append(answer)
+            else:
+                try:
+                    results[ticker] = self.validate_answer(answer)
+                except ValueError as e:
+                    error = e
+
+            if error is not None:
+                print(f"Failed answer for {ticker} ({error_type}):", error)
+                results[ticker] = {
+                    "decision": "hold",
+                    "reason": f"Failed answer: {error}",
+                    "error": str(error),
+                    "error_type": error_type,
+                }
+
+        # 모든 종목이 API 오류로 실패한 경우는 장애로 보고 오류를 전달
+        if len(api_errors) == len(tickers):
+            raise api_errors[0]
+
+        print("answers", results)
+        return results
@@ -10,7 +10,7 @@ def main():
     analysis_data = exchange.prepare_analysis_data()
 
     # AI 매매 결정
-    answer = ai_agent.invoke(source_data=analysis_data)
+    answer = ai_agent.invoke(source_data=analysis_data, ticker=exchange.ticker)
 
     # 매매 실행
     exchange.trading(answer=answer)
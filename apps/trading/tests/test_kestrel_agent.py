@@ -0,0 +1,144 @@
+import unittest
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableLambda
+
+from src.agents.kestrel_agent import KestrelAiModelAgent
+
+
+def create_agent(answer_fn) -> KestrelAiModelAgent:
+    """
+    네트워크 호출 없이 stub 체인을 사용하는 에이전트를 생성하는 함수
+    """
+
+    agent = KestrelAiModelAgent.__new__(KestrelAiModelAgent)
+    agent.chain = RunnableLambda(answer_fn)
+    return agent
+
+
+class ValidateAnswerTest(unittest.TestCase):
+    def setUp(self):
+        self.agent = create_agent(lambda inputs: inputs)
+
+    def test_valid_answer(self):
+        answer = self.agent.validate_answer({"decision": "buy", "reason": "uptrend"})
+        self.assertEqual(answer, {"decision": "buy", "reason": "uptrend"})
+
+    def test_wrong_case_decision(self):
+        answer = self.agent.validate_answer({"decision": "SELL", "reason": "RSI 75"})
+        self.assertEqual(answer["decision"], "sell")
+
+    def test_invalid_decision(self):
+        with self.assertRaises(ValueError):
+            self.agent.validate_answer({"decision": "short", "reason": "downtrend"})
+
+    def test_missing_reason(self):
+        with self.assertRaises(ValueError):
+            self.agent.validate_answer({"decision": "hold"})
+
+    def test_non_dict_answer(self):
+        with self.assertRaises(ValueError):
+            self.agent.validate_answer(["hold"])
+
+
+class InvokeTest(unittest.TestCase):
+    def test_invoke_passes_ticker_and_validates(self):
+        agent = create_agent(
+            lambda inputs: {"decision": "HOLD", "reason": inputs["ticker"]}
+        )
+        answer = agent.invoke(source_data="{}")
+        self.assertEqual(answer, {"decision": "hold", "reason": "KRW-BTC"})
+
+    def test_invoke_invalid_answer(self):
+        agent = create_agent(lambda inputs: {"decision": "buy"})
+        with self.assertRaises(ValueError):
+            agent.invoke(source_data="{}")
+
+
+class BatchInvokeTest(unittest.TestCase):
+    def test_results_map_to_tickers(self):
+        agent = create_agent(
+            lambda inputs: {
+                "decision": "buy",
+                "reason": f"{inputs['ticker']}:{inputs['source']}",
+            }
+        )
+        results = agent.batch_invoke(
+            {"KRW-BTC": "btc", "KRW-ETH": "eth", "KRW-XRP": "xrp"},
+            max_concurrency=2,
+        )
+        self.assertEqual(
+            results,
+            {
+                "KRW-BTC": {"decision": "buy", "reason": "KRW-BTC:btc"},
+                "KRW-ETH": {"decision": "buy", "reason": "KRW-ETH:eth"},
+                "KRW-XRP": {"decision": "buy", "reason": "KRW-XRP:xrp"},
+            },
+        )
+
+    def test_empty_source_data(self):
+        agent = create_agent(lambda inputs: {"decision": "buy", "reason": "x"})
+        self.assertEqual(agent.batch_invoke({}), {})
+
+    def test_invalid_answer_falls_back_to_hold(self):
+        def answer_fn(inputs):
+            if inputs["ticker"] == "KRW-ETH":
+                return {"decision": "buy"}
+            if inputs["ticker"] == "KRW-XRP":
+                raise OutputParserException("Invalid json output")
+            return {"decision": "Sell", "reason": "take profit"}
+
+        agent = create_agent(answer_fn)
+        results = agent.batch_invoke(
+            {"KRW-BTC": "btc", "KRW-ETH": "eth", "KRW-XRP": "xrp"}
+        )
+
+        self.assertEqual(
+            results["KRW-BTC"], {"decision": "sell", "reason": "take profit"}
+        )
+        for ticker in ("KRW-ETH", "KRW-XRP"):
+            self.assertEqual(results[ticker]["decision"], "hold")
+            self.assertEqual(results[ticker]["error_type"], "parse")
+            self.assertIn("error", results[ticker])
+
+    def test_partial_api_error_keeps_other_decisions(self):
+        def answer_fn(inputs):
+            if inputs["ticker"] == "KRW-ETH":
+                raise ValueError({"code": "rate_limit_exceeded"})
+            return {"decision": "buy", "reason": inputs["ticker"]}
+
+        agent = create_agent(answer_fn)
+        results = agent.batch_invoke(
+            {"KRW-BTC": "btc", "KRW-ETH": "eth", "KRW-XRP": "xrp"}
+        )
+
+        self.assertEqual(results["KRW-BTC"], {"decision": "buy", "reason": "KRW-BTC"})
+        self.assertEqual(results["KRW-XRP"], {"decision": "buy", "reason": "KRW-XRP"})
+        self.assertEqual(results["KRW-ETH"]["decision"], "hold")
+        self.assertEqual(results["KRW-ETH"]["error_type"], "api")
+
+    def test_api_error_is_raised(self):
+        def answer_fn(inputs):
+            raise ConnectionError("OpenAI unavailable")
+
+        agent = create_agent(answer_fn)
+        with self.assertRaises(ConnectionError):
+            agent.batch_invoke({"KRW-BTC": "btc", "KRW-ETH": "eth"})
+
+    def test_api_value_error_is_raised(self):
+        def answer_fn(inputs):
+            raise ValueError({"code": "server_error", "message": "server error"})
+
+        agent = create_agent(answer_fn)
+        with self.assertRaises(ValueError):
+            agent.batch_invoke({"KRW-BTC": "btc", "KRW-ETH": "eth"})
+
+    def test_invalid_max_concurrency(self):
+        agent = create_agent(lambda inputs: {"decision": "buy", "reason": "x"})
+        for max_concurrency in (0, -1):
+            with self.assertRaises(ValueError):
+                agent.batch_invoke({"KRW-BTC": "btc"}, max_concurrency=max_concurrency)
+
+
+if __name__ == "__main__":
+    unittest.main()